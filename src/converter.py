@@ -6,10 +6,269 @@ This module provides functionality to convert URDF (Unified Robot Description Fo
 files to XACRO (XML Macros) format with parameterization and macro definitions.
 """
 
-import xml.etree.ElementTree as ET
-from typing import Dict, List, Optional, Tuple, Literal
+import copy
+import functools
+import glob
+import io
+import operator
+import os
+import re
+import sys
+import warnings
+from xml.sax.saxutils import escape
+from collections import OrderedDict
+from concurrent.futures import ProcessPoolExecutor
+from typing import (
+    BinaryIO,
+    Callable,
+    Dict,
+    FrozenSet,
+    List,
+    Optional,
+    Set,
+    TextIO,
+    Tuple,
+    Literal,
+    Union,
+)
 from dataclasses import dataclass
-import tyro
+
+# Compiled ${name} substitution, built with `python setup.py build_ext --inplace`
+try:
+    from converter_fast import substitute as _substitute_compiled
+except ImportError:
+    _substitute_compiled = None
+
+# Prefer lxml (libxml2-backed) for parsing and serialization, falling back to
+# the stdlib ElementTree API, which lxml.etree is compatible with.
+try:
+    from lxml import etree as ET
+
+    HAS_LXML = True
+except ImportError:
+    # cElementTree only exists before Python 3.9; later ElementTree loads the
+    # C accelerator on its own
+    try:
+        import xml.etree.cElementTree as ET
+    except ImportError:
+        import xml.etree.ElementTree as ET
+
+    HAS_LXML = False
+
+    if ET.Element is getattr(ET, "_Element_Py", None):
+        warnings.warn(
+            "lxml and the ElementTree C accelerator are unavailable; "
+            "falling back to the pure-Python XML implementation",
+            RuntimeWarning,
+        )
+
+XACRO_NS = "http://www.ros.org/wiki/xacro"
+XML_DECLARATION = '<?xml version="1.0"?>'
+
+ET.register_namespace("xacro", XACRO_NS)
+
+if HAS_LXML:
+    # Match the stdlib parser, which drops comments and processing instructions.
+    # Parsers are passed explicitly rather than installed with
+    # set_default_parser(), which would leak into other lxml users (yourdfpy).
+    _PARSER_OPTIONS = dict(
+        remove_comments=True, remove_pis=True, remove_blank_text=True
+    )
+    _XML_PARSER = ET.XMLParser(**_PARSER_OPTIONS)
+    # For str input encoded to UTF-8, overriding any encoding declaration
+    _XML_STR_PARSER = ET.XMLParser(encoding="utf-8", **_PARSER_OPTIONS)
+
+
+def _xacro_tag(local_name: str) -> str:
+    """Return the namespace-qualified tag for a XACRO element"""
+    return f"{{{XACRO_NS}}}{local_name}"
+
+
+def _parse_xml(content: Union[str, bytes]) -> ET.Element:
+    """Parse XML content with the active ElementTree backend"""
+    if HAS_LXML:
+        # lxml refuses str input that carries an encoding declaration, so
+        # encode it and make the parser ignore the declared encoding
+        if isinstance(content, str):
+            return ET.fromstring(content.encode("utf-8"), _XML_STR_PARSER)
+        return ET.fromstring(content, _XML_PARSER)
+    return ET.fromstring(content)
+
+
+def _caller_stacklevel() -> int:
+    """Return the warnings stacklevel of the nearest caller outside this module"""
+    frame = sys._getframe(1)
+    level = 1
+    while frame is not None and frame.f_code.co_filename == __file__:
+        frame = frame.f_back
+        level += 1
+    return level
+
+
+def _parse_xml_file(source: Union[str, BinaryIO]) -> ET.Element:
+    """Parse an XML file path or binary file object with the active backend"""
+    if HAS_LXML:
+        return ET.parse(source, _XML_PARSER).getroot()
+    return ET.parse(source).getroot()
+
+
+# ${name} references to XACRO properties and macro parameters
+_PROP_RE = re.compile(r"\$\{([^}]+)\}")
+
+
+def _compile_macro(body: str) -> Callable[[Dict[str, str]], str]:
+    """
+    Generate a function that fills the ${name} sites of a serialized macro body
+
+    The body is split into literal chunks and parameter lookups once, and the
+    resulting expression is compiled to a dedicated function, so expanding a
+    macro is a single join. Names without a value keep their ${name} reference.
+
+    Args:
+        body: Serialized macro body
+
+    Returns:
+        Function mapping parameter values to the filled body
+    """
+    parts = []
+    position = 0
+    for match in _PROP_RE.finditer(body):
+        if match.start() > position:
+            parts.append(repr(body[position : match.start()]))
+        parts.append(f"p.get({match.group(1)!r}, {match.group(0)!r})")
+        position = match.end()
+    if position < len(body):
+        parts.append(repr(body[position:]))
+
+    # Trailing commas keep a one-element tuple when the body has a single part
+    items = "".join(f"{part}, " for part in parts)
+    source = f"def expand(p):\n    return ''.join(({items}))\n"
+    namespace: Dict[str, Callable[[Dict[str, str]], str]] = {}
+    exec(compile(source, "<xacro macro>", "exec"), namespace)
+    return namespace["expand"]
+
+
+# Number of macro expansions kept by XacroToURDFConverter
+MACRO_EXPANSION_CACHE_SIZE = 128
+
+# Macro name and parameter values identifying a cached expansion
+_ExpansionKey = Tuple[str, FrozenSet[Tuple[str, str]]]
+
+INERTIA_COMPONENTS = ("ixx", "ixy", "ixz", "iyy", "iyz", "izz")
+LIMIT_ATTRIBUTES = ("lower", "upper", "effort", "velocity")
+
+
+def _drop_layout_text(element: ET.Element) -> None:
+    """
+    Drop tails and layout-only text from a copied subtree
+
+    Text is kept only on leaf elements with non-whitespace content, matching
+    what the converters copy element by element.
+    """
+    for elem in element.iter():
+        elem.tail = None
+        if len(elem) > 0 or (elem.text and not elem.text.strip()):
+            elem.text = None
+
+
+def _strip_elements(root: ET.Element, tags: Set[str]) -> None:
+    """
+    Remove all descendants with one of the given tags, with their tails
+
+    ElementTree counterpart of lxml's strip_elements(..., with_tail=True).
+    """
+    parents = [
+        parent for parent in root.iter() if any(child.tag in tags for child in parent)
+    ]
+    for parent in parents:
+        parent[:] = [child for child in parent if child.tag not in tags]
+
+
+@functools.lru_cache(maxsize=1024)
+def _extract_mesh_pattern(mesh_filename: str) -> str:
+    """
+    Extract base pattern from mesh filename
+
+    Cached, since links of repeated arms share the same mesh files.
+    """
+    if not mesh_filename:
+        return "unknown"
+
+    # Extract package and base name
+    if "package://" in mesh_filename:
+        parts = mesh_filename.split("/")
+        if len(parts) >= 3:
+            package = parts[1]
+            filename = parts[-1]
+            # Remove file extension
+            base_name = filename.rsplit(".", 1)[0]
+            return f"{package}_{base_name}"
+
+    return "default"
+
+
+def _compile_path(path: str):
+    """
+    Compile an element path once for repeated evaluation
+
+    Returns a callable that maps a context element to the list of matches,
+    backed by a precompiled XPath under lxml and findall() otherwise. Callers
+    keep the returned object around so lxml reuses the compiled expression
+    and its evaluation context instead of recompiling a string per call.
+    """
+    if HAS_LXML:
+        return ET.XPath(path, smart_strings=False)
+    return operator.methodcaller("findall", path)
+
+
+def _iterparse(
+    source: Union[str, BinaryIO, TextIO],
+    events: Tuple[str, ...],
+    encoding: Optional[str] = None,
+):
+    """
+    Incrementally parse XML from a file path or file object
+
+    Args:
+        source: Path or file object to parse; lxml only reads binary files,
+            ElementTree also reads text files
+        events: Parse events to report
+        encoding: Encoding overriding the document's declaration (lxml only)
+    """
+    if HAS_LXML:
+        return ET.iterparse(
+            source,
+            events=events,
+            encoding=encoding,
+            **_PARSER_OPTIONS,
+        )
+    return ET.iterparse(source, events=events)
+
+
+class _RstripWriter:
+    """
+    Binary writer that drops whitespace at the very end of the written data
+
+    Whitespace at the end of each chunk is held back and only written once
+    more content follows, so streamed output matches str.rstrip().
+    """
+
+    __slots__ = ("_fp", "_pending")
+
+    def __init__(self, fp: BinaryIO):
+        self._fp = fp
+        self._pending = b""
+
+    def write(self, data: bytes) -> int:
+        content = data.rstrip()
+        if content:
+            if self._pending:
+                self._fp.write(self._pending)
+            self._fp.write(content)
+            self._pending = data[len(content) :]
+        else:
+            self._pending += data
+        return len(data)
 
 
 @dataclass
@@ -42,6 +301,17 @@ class URDFToXacroConverter:
     Converts URDF files to XACRO format with parameterization and macro generation
     """
 
+    # First geometry/mesh under a visual or collision element
+    _XP_GEOMETRY_MESH = _compile_path("geometry[1]/mesh[1]")
+
+    __slots__ = (
+        "links",
+        "joints",
+        "materials",
+        "properties",
+        "macros",
+    )
+
     def __init__(self):
         self.links: Dict[str, LinkInfo] = {}
         self.joints: Dict[str, JointInfo] = {}
@@ -57,31 +327,71 @@ class URDFToXacroConverter:
             urdf_content: String content of the URDF file
 
         Returns:
-            Root element of the parsed XML
+            Root element of the parsed XML, with its children detached
         """
-        try:
-            root = ET.fromstring(urdf_content)
-        except ET.ParseError as e:
-            raise ValueError(f"Invalid URDF XML: {e}")
+        # The str is already decoded, so any encoding declaration must be ignored
+        if HAS_LXML:
+            # lxml only reads bytes, so re-encode and override the declaration
+            source = io.BytesIO(urdf_content.encode("utf-8"))
+            return self.parse_urdf_file(source, encoding="utf-8")
+        # ElementTree parses text streams without decoding them again
+        return self.parse_urdf_file(io.StringIO(urdf_content))
+
+    def parse_urdf_file(
+        self,
+        urdf_file: Union[str, BinaryIO, TextIO],
+        encoding: Optional[str] = None,
+    ) -> ET.Element:
+        """
+        Stream a URDF document and extract components
 
-        if root.tag != "robot":
-            raise ValueError("URDF file must have 'robot' as root element")
+        Top-level elements are dispatched as soon as they are complete and then
+        detached from the root, so the whole document is never held in memory.
+        Only the extracted links, joints and materials are retained.
 
-        # Extract links
-        for link in root.findall("link"):
-            link_info = self._extract_link_info(link)
-            self.links[link_info.name] = link_info
+        Args:
+            urdf_file: Path to the URDF file or a binary file object
+            encoding: Encoding overriding the document's declaration (lxml only)
 
-        # Extract joints
-        for joint in root.findall("joint"):
-            joint_info = self._extract_joint_info(joint)
-            self.joints[joint_info.name] = joint_info
+        Returns:
+            Root element of the parsed XML, with its children detached
+        """
+        root = None
+        depth = 0
+        try:
+            for event, elem in _iterparse(
+                urdf_file, ("start", "end"), encoding=encoding
+            ):
+                if event == "start":
+                    if root is None:
+                        root = elem
+                        if root.tag != "robot":
+                            raise ValueError(
+                                "URDF file must have 'robot' as root element"
+                            )
+                    depth += 1
+                    continue
+
+                depth -= 1
+                if depth != 1:
+                    continue
+
+                if elem.tag == "link":
+                    link_info = self._extract_link_info(elem)
+                    self.links[link_info.name] = link_info
+                elif elem.tag == "joint":
+                    joint_info = self._extract_joint_info(elem)
+                    self.joints[joint_info.name] = joint_info
+                elif elem.tag == "material" and elem.get("name"):
+                    self.materials[elem.get("name")] = elem
+                else:
+                    # Not used for XACRO generation
+                    elem.clear()
 
-        # Extract materials
-        for material in root.findall("material"):
-            name = material.get("name")
-            if name:
-                self.materials[name] = material
+                # Extracted elements stay referenced by their info objects
+                del root[:]
+        except ET.ParseError as e:
+            raise ValueError(f"Invalid URDF XML: {e}")
 
         return root
 
@@ -89,50 +399,58 @@ class URDFToXacroConverter:
         """Extract information from a link element"""
         name = link_element.get("name", "")
 
+        # Locate the first inertial, visual and collision children in one pass
+        inertial = visual = collision = None
+        for child in link_element:
+            if child.tag == "inertial":
+                if inertial is None:
+                    inertial = child
+            elif child.tag == "visual":
+                if visual is None:
+                    visual = child
+            elif child.tag == "collision":
+                if collision is None:
+                    collision = child
+
+        mass_elem = inertia_elem = None
+        if inertial is not None:
+            for child in inertial:
+                if child.tag == "mass":
+                    if mass_elem is None:
+                        mass_elem = child
+                elif child.tag == "inertia":
+                    if inertia_elem is None:
+                        inertia_elem = child
+
         # Extract mass
         mass = None
-        inertial = link_element.find("inertial")
-        if inertial is not None:
-            mass_elem = inertial.find("mass")
-            if mass_elem is not None:
-                try:
-                    mass = float(mass_elem.get("value", 0))
-                except ValueError:
-                    mass = None
+        if mass_elem is not None:
+            try:
+                mass = float(mass_elem.get("value", 0))
+            except ValueError:
+                mass = None
 
         # Extract inertia
         inertia = None
-        if inertial is not None:
-            inertia_elem = inertial.find("inertia")
-            if inertia_elem is not None:
-                inertia = {
-                    "ixx": float(inertia_elem.get("ixx", 0)),
-                    "ixy": float(inertia_elem.get("ixy", 0)),
-                    "ixz": float(inertia_elem.get("ixz", 0)),
-                    "iyy": float(inertia_elem.get("iyy", 0)),
-                    "iyz": float(inertia_elem.get("iyz", 0)),
-                    "izz": float(inertia_elem.get("izz", 0)),
-                }
+        if inertia_elem is not None:
+            inertia = {
+                component: float(inertia_elem.get(component, 0))
+                for component in INERTIA_COMPONENTS
+            }
 
         # Extract mesh filenames
         visual_mesh = None
         collision_mesh = None
 
-        visual = link_element.find("visual")
         if visual is not None:
-            geometry = visual.find("geometry")
-            if geometry is not None:
-                mesh = geometry.find("mesh")
-                if mesh is not None:
-                    visual_mesh = mesh.get("filename")
+            meshes = self._XP_GEOMETRY_MESH(visual)
+            if meshes:
+                visual_mesh = meshes[0].get("filename")
 
-        collision = link_element.find("collision")
         if collision is not None:
-            geometry = collision.find("geometry")
-            if geometry is not None:
-                mesh = geometry.find("mesh")
-                if mesh is not None:
-                    collision_mesh = mesh.get("filename")
+            meshes = self._XP_GEOMETRY_MESH(collision)
+            if meshes:
+                collision_mesh = meshes[0].get("filename")
 
         return LinkInfo(
             name=name,
@@ -148,15 +466,28 @@ class URDFToXacroConverter:
         name = joint_element.get("name", "")
         joint_type = joint_element.get("type", "")
 
+        # Locate the first parent, child, axis and limit children in one pass
+        parent_elem = child_elem = axis_elem = limit_elem = None
+        for sub_elem in joint_element:
+            if sub_elem.tag == "parent":
+                if parent_elem is None:
+                    parent_elem = sub_elem
+            elif sub_elem.tag == "child":
+                if child_elem is None:
+                    child_elem = sub_elem
+            elif sub_elem.tag == "axis":
+                if axis_elem is None:
+                    axis_elem = sub_elem
+            elif sub_elem.tag == "limit":
+                if limit_elem is None:
+                    limit_elem = sub_elem
+
         # Extract parent and child
-        parent_elem = joint_element.find("parent")
-        child_elem = joint_element.find("child")
         parent = parent_elem.get("link", "") if parent_elem is not None else ""
         child = child_elem.get("link", "") if child_elem is not None else ""
 
         # Extract axis
         axis = None
-        axis_elem = joint_element.find("axis")
         if axis_elem is not None:
             xyz = axis_elem.get("xyz", "0 0 0")
             try:
@@ -168,10 +499,9 @@ class URDFToXacroConverter:
 
         # Extract limits
         limits = None
-        limit_elem = joint_element.find("limit")
         if limit_elem is not None:
             limits = {}
-            for attr in ["lower", "upper", "effort", "velocity"]:
+            for attr in LIMIT_ATTRIBUTES:
                 value = limit_elem.get(attr)
                 if value is not None:
                     try:
@@ -203,7 +533,7 @@ class URDFToXacroConverter:
         for link in self.links.values():
             if link.visual_mesh:
                 # Extract pattern from mesh filename
-                mesh_base = self._extract_mesh_pattern(link.visual_mesh)
+                mesh_base = _extract_mesh_pattern(link.visual_mesh)
                 if mesh_base not in mesh_patterns:
                     mesh_patterns[mesh_base] = []
                 mesh_patterns[mesh_base].append(link)
@@ -215,23 +545,6 @@ class URDFToXacroConverter:
 
         return patterns
 
-    def _extract_mesh_pattern(self, mesh_filename: str) -> str:
-        """Extract base pattern from mesh filename"""
-        if not mesh_filename:
-            return "unknown"
-
-        # Extract package and base name
-        if "package://" in mesh_filename:
-            parts = mesh_filename.split("/")
-            if len(parts) >= 3:
-                package = parts[1]
-                filename = parts[-1]
-                # Remove file extension
-                base_name = filename.rsplit(".", 1)[0]
-                return f"{package}_{base_name}"
-
-        return "default"
-
     def _create_properties(self):
         """Create XACRO properties for common values"""
         # Create properties for common dimensions, masses, etc.
@@ -248,26 +561,50 @@ class URDFToXacroConverter:
         self.properties["prefix"] = ""
         self.properties["base_link_name"] = "base_link"
 
-    def generate_xacro(self, robot_name: str, original_root: ET.Element) -> str:
+    def generate_xacro(
+        self, robot_name: str, original_root: ET.Element, pretty: bool = True
+    ) -> str:
         """
         Generate XACRO content from parsed URDF
 
         Args:
             robot_name: Name of the robot
             original_root: Original URDF root element
+            pretty: Indent the output; disable for compact, faster output
 
         Returns:
             XACRO content as string
         """
+        xacro_root = self._build_xacro_tree(robot_name, original_root)
+
+        # Convert to string with proper formatting
+        return self._format_xacro_xml(xacro_root, pretty)
+
+    def _build_xacro_tree(
+        self, robot_name: str, original_root: ET.Element
+    ) -> ET.Element:
+        """
+        Build the XACRO element tree from parsed URDF
+
+        Args:
+            robot_name: Name of the robot
+            original_root: Original URDF root element
+
+        Returns:
+            Root element of the XACRO document
+        """
         # Create root element with XACRO namespace
-        xacro_root = ET.Element("robot")
+        if HAS_LXML:
+            xacro_root = ET.Element("robot", nsmap={"xacro": XACRO_NS})
+        else:
+            # ElementTree declares the registered xacro prefix on serialization
+            xacro_root = ET.Element("robot")
         xacro_root.set("name", robot_name)
-        xacro_root.set("xmlns:xacro", "http://www.ros.org/wiki/xacro")
 
         # Add common properties
         self._create_properties()
         for prop_name, prop_value in self.properties.items():
-            prop_elem = ET.SubElement(xacro_root, "xacro:property")
+            prop_elem = ET.SubElement(xacro_root, _xacro_tag("property"))
             prop_elem.set("name", prop_name)
             prop_elem.set("value", prop_value)
 
@@ -280,12 +617,11 @@ class URDFToXacroConverter:
         xacro_root.append(main_macro)
 
         # Create macro call for the main robot
-        macro_call = ET.SubElement(xacro_root, f"xacro:{robot_name}")
+        macro_call = ET.SubElement(xacro_root, _xacro_tag(robot_name))
         macro_call.set("prefix", "${prefix}")
         macro_call.set("base_link_name", "${base_link_name}")
 
-        # Convert to string with proper formatting
-        return self._format_xacro_xml(xacro_root)
+        return xacro_root
 
     def _create_main_robot_macro(
         self, robot_name: str, original_root: ET.Element
@@ -300,7 +636,7 @@ class URDFToXacroConverter:
         Returns:
             Main robot macro element
         """
-        macro_elem = ET.Element("xacro:macro")
+        macro_elem = ET.Element(_xacro_tag("macro"))
         macro_elem.set("name", f"{robot_name}")
         macro_elem.set("params", "prefix base_link_name")
 
@@ -313,23 +649,22 @@ class URDFToXacroConverter:
             if sub_macro is not None:
                 macro_elem.append(sub_macro)
 
-        # Process all links with prefix support
-        processed_links = set()
-
-        # Use macros for pattern-matched links
-        for pattern_name, links in patterns.items():
-            for link in links:
-                if link.name not in processed_links:
-                    macro_call = self._create_macro_call(
-                        pattern_name, link, use_prefix=True
-                    )
-                    if macro_call is not None:
-                        macro_elem.append(macro_call)
-                    processed_links.add(link.name)
-
-        # Add remaining links with prefix support
+        # Process all links with prefix support in a single pass, using macros
+        # for pattern-matched links
+        pattern_of = {
+            link.name: pattern_name
+            for pattern_name, links in patterns.items()
+            for link in links
+        }
         for link in self.links.values():
-            if link.name not in processed_links:
+            pattern_name = pattern_of.get(link.name)
+            if pattern_name is not None:
+                macro_call = self._create_macro_call(
+                    pattern_name, link, use_prefix=True
+                )
+                if macro_call is not None:
+                    macro_elem.append(macro_call)
+            else:
                 prefixed_link = self._create_prefixed_link(link)
                 macro_elem.append(prefixed_link)
 
@@ -353,10 +688,10 @@ class URDFToXacroConverter:
         Returns:
             Macro element or None if macro cannot be created
         """
-        if not template_link.element:
+        if len(template_link.element) == 0:
             return None
 
-        macro_elem = ET.Element("xacro:macro")
+        macro_elem = ET.Element(_xacro_tag("macro"))
         macro_elem.set("name", f"{pattern_name}_link")
 
         # Add parameters
@@ -380,28 +715,25 @@ class URDFToXacroConverter:
     ):
         """Parameterize a link element for macro use"""
         for child in source_elem:
-            new_child = ET.SubElement(target_elem, child.tag)
-
-            # Copy attributes, parameterizing where appropriate
-            for attr_name, attr_value in child.attrib.items():
-                if attr_name == "filename" and "package://" in attr_value:
-                    new_child.set(attr_name, "${mesh_file}")
-                elif attr_name == "value" and child.tag == "mass":
-                    new_child.set(attr_name, "${mass}")
-                else:
-                    new_child.set(attr_name, attr_value)
-
-            # Recursively process children
-            if len(child) > 0:
-                self._parameterize_link_element(child, new_child)
-            elif child.text and child.text.strip():
-                new_child.text = child.text
+            new_child = copy.deepcopy(child)
+            _drop_layout_text(new_child)
+            self._apply_parameter_rewrites(new_child)
+            target_elem.append(new_child)
+
+    def _apply_parameter_rewrites(self, element: ET.Element):
+        """Replace mesh files and mass values below an element with macro parameters"""
+        for elem in element.iter():
+            filename = elem.get("filename")
+            if filename is not None and "package://" in filename:
+                elem.set("filename", "${mesh_file}")
+            if elem.tag == "mass" and elem.get("value") is not None:
+                elem.set("value", "${mass}")
 
     def _create_macro_call(
         self, pattern_name: str, link: LinkInfo, use_prefix: bool = False
     ) -> Optional[ET.Element]:
         """Create a macro call for a specific link"""
-        call_elem = ET.Element(f"xacro:{pattern_name}_link")
+        call_elem = ET.Element(_xacro_tag(f"{pattern_name}_link"))
 
         if use_prefix:
             call_elem.set("prefix", "${prefix}")
@@ -444,8 +776,7 @@ class URDFToXacroConverter:
             child_elem = ET.SubElement(link_elem, child.tag)
 
             # Copy attributes of the child element
-            for attr_name, attr_value in child.attrib.items():
-                child_elem.set(attr_name, attr_value)
+            child_elem.attrib.update(child.attrib)
 
             # Copy the contents of the child element
             self._copy_element_with_parameterization(child, child_elem)
@@ -478,23 +809,18 @@ class URDFToXacroConverter:
 
         # Copy and modify child elements
         for child in joint.element:
-            new_child = ET.SubElement(joint_elem, child.tag)
-
-            # Copy attributes with prefix handling for parent/child links
-            for attr_name, attr_value in child.attrib.items():
-                if attr_name == "link":
-                    if attr_value == "base_link":
-                        new_child.set(attr_name, "${prefix}${base_link_name}")
-                    else:
-                        new_child.set(attr_name, f"${{prefix}}{attr_value}")
+            new_child = copy.deepcopy(child)
+            _drop_layout_text(new_child)
+
+            # Prefix parent/child link references
+            link_name = new_child.get("link")
+            if link_name is not None:
+                if link_name == "base_link":
+                    new_child.set("link", "${prefix}${base_link_name}")
                 else:
-                    new_child.set(attr_name, attr_value)
+                    new_child.set("link", f"${{prefix}}{link_name}")
 
-            # Copy child elements recursively
-            if len(child) > 0:
-                self._copy_element_with_parameterization(child, new_child)
-            elif child.text and child.text.strip():
-                new_child.text = child.text
+            joint_elem.append(new_child)
 
         return joint_elem
 
@@ -502,54 +828,57 @@ class URDFToXacroConverter:
         self, source: ET.Element, target: ET.Element
     ):
         """
-        Copy element structure with parameterization for mesh files and mass values
+        Copy element structure, keeping mesh files and mass values as-is
 
         Args:
             source: Source element to copy from
             target: Target element to copy to
         """
+        # Deep-copy whole subtrees and tidy them in one pass over the copies
         for child in source:
-            new_child = ET.SubElement(target, child.tag)
-
-            # Copy attributes, parameterizing where appropriate
-            for attr_name, attr_value in child.attrib.items():
-                if attr_name == "filename" and "package://" in attr_value:
-                    # Keep mesh files as-is, or could parameterize if needed
-                    new_child.set(attr_name, attr_value)
-                elif attr_name == "value" and child.tag == "mass":
-                    # Could parameterize mass values if needed
-                    new_child.set(attr_name, attr_value)
-                else:
-                    new_child.set(attr_name, attr_value)
-
-            # Recursively process children
-            if len(child) > 0:
-                self._copy_element_with_parameterization(child, new_child)
-            elif child.text and child.text.strip():
-                new_child.text = child.text
+            new_child = copy.deepcopy(child)
+            _drop_layout_text(new_child)
+            target.append(new_child)
 
-    def _format_xacro_xml(self, root: ET.Element) -> str:
+    def _format_xacro_xml(self, root: ET.Element, pretty: bool = True) -> str:
         """Format XML with proper indentation and XACRO header"""
-        # Add XML declaration and pretty formatting
-        xml_str = ET.tostring(root, encoding="unicode")
-
-        # Parse with minidom for pretty printing
-        from xml.dom import minidom
-
-        dom = minidom.parseString(xml_str)
-        pretty_xml = dom.toprettyxml(indent="  ")
-
-        # Remove empty lines and fix formatting
-        lines = [line for line in pretty_xml.split("\n") if line.strip()]
+        if HAS_LXML:
+            # Hoist the xacro namespace declarations of detached macro elements
+            ET.cleanup_namespaces(root)
+            pretty_xml = ET.tostring(root, pretty_print=pretty, encoding="unicode")
+        else:
+            if pretty:
+                # Indent in place instead of reparsing through minidom
+                ET.indent(root, space="  ")
+            pretty_xml = ET.tostring(root, encoding="unicode")
 
-        # Replace the first line with proper XML declaration
-        if lines and lines[0].startswith("<?xml"):
-            lines[0] = '<?xml version="1.0"?>'
+        return f"{XML_DECLARATION}\n{pretty_xml.rstrip()}"
 
-        return "\n".join(lines)
+    def _serialize_to(
+        self, root: ET.Element, fp: BinaryIO, pretty: bool = True
+    ) -> None:
+        """Write a XACRO tree to a binary file in the _format_xacro_xml layout"""
+        fp.write(f"{XML_DECLARATION}\n".encode("utf-8"))
+        tree = ET.ElementTree(root)
+        # Hold back trailing whitespace, which _format_xacro_xml strips
+        writer = _RstripWriter(fp)
+        if HAS_LXML:
+            ET.cleanup_namespaces(root)
+            # libxml2 formats and writes incrementally, without a full string
+            tree.write(
+                writer, pretty_print=pretty, encoding="utf-8", xml_declaration=False
+            )
+        else:
+            if pretty:
+                ET.indent(root, space="  ")
+            tree.write(writer, encoding="utf-8", xml_declaration=False)
 
     def convert_file(
-        self, input_file: str, output_file: str, robot_name: Optional[str] = None
+        self,
+        input_file: str,
+        output_file: str,
+        robot_name: Optional[str] = None,
+        pretty: bool = True,
     ) -> None:
         """
         Convert a URDF file to XACRO format
@@ -558,35 +887,36 @@ class URDFToXacroConverter:
             input_file: Path to input URDF file
             output_file: Path to output XACRO file
             robot_name: Name for the robot (extracted from URDF if not provided)
+            pretty: Indent the output; disable for compact, faster output
         """
-        # Read URDF file
+        # Open URDF file
         try:
-            with open(input_file, "r", encoding="utf-8") as f:
-                urdf_content = f.read()
+            urdf_file = open(input_file, "rb")
         except FileNotFoundError:
             raise FileNotFoundError(f"URDF file not found: {input_file}")
         except Exception as e:
             raise IOError(f"Error reading URDF file: {e}")
 
         # Parse URDF
-        root = self.parse_urdf(urdf_content)
+        with urdf_file:
+            root = self.parse_urdf_file(urdf_file)
 
         # Extract robot name if not provided
         if robot_name is None:
             robot_name = root.get("name", "robot")
 
         # Generate XACRO
-        xacro_content = self.generate_xacro(robot_name, root)
+        xacro_root = self._build_xacro_tree(robot_name, root)
 
-        # Write XACRO file
+        # Stream XACRO file
         try:
-            with open(output_file, "w", encoding="utf-8") as f:
-                f.write(xacro_content)
+            with open(output_file, "wb") as f:
+                self._serialize_to(xacro_root, f, pretty)
         except Exception as e:
             raise IOError(f"Error writing XACRO file: {e}")
 
     def convert_string(
-        self, urdf_content: str, robot_name: Optional[str] = None
+        self, urdf_content: str, robot_name: Optional[str] = None, pretty: bool = True
     ) -> str:
         """
         Convert URDF content string to XACRO format
@@ -594,6 +924,7 @@ class URDFToXacroConverter:
         Args:
             urdf_content: URDF content as string
             robot_name: Name for the robot (extracted from URDF if not provided)
+            pretty: Indent the output; disable for compact, faster output
 
         Returns:
             XACRO content as string
@@ -606,7 +937,7 @@ class URDFToXacroConverter:
             robot_name = root.get("name", "robot")
 
         # Generate and return XACRO
-        return self.generate_xacro(robot_name, root)
+        return self.generate_xacro(robot_name, root, pretty)
 
 
 class XacroToURDFConverter:
@@ -614,77 +945,222 @@ class XacroToURDFConverter:
     Converts XACRO files to URDF format by expanding macros and resolving properties
     """
 
+    if HAS_LXML:
+        # Children in the XACRO namespace, selected in one libxml2 pass
+        _XP_XACRO_CHILDREN = ET.XPath("*[contains(namespace-uri(), 'xacro')]")
+
+    __slots__ = (
+        "properties",
+        "macros",
+        "includes",
+        "_compiled_macros",
+        "_expansion_cache",
+        "_resolved_texts",
+        "_definition_tags",
+        "_undefined_references",
+    )
+
     def __init__(self):
         self.properties: Dict[str, str] = {}
         self.macros: Dict[str, ET.Element] = {}
         self.includes: List[str] = []
-
-    def parse_xacro(self, xacro_content: str, base_path: str = "") -> ET.Element:
+        # Generated expansion functions of the macro bodies, keyed by macro name
+        self._compiled_macros: Dict[str, Callable[[Dict[str, str]], str]] = {}
+        # Serialized expansions keyed by macro name and parameter values
+        self._expansion_cache: "OrderedDict[_ExpansionKey, List[bytes]]" = OrderedDict()
+        # Texts with references resolved against the current properties
+        self._resolved_texts: Dict[str, str] = {}
+        # Tags of definitions left in place for a single strip_elements pass
+        self._definition_tags: Set[str] = set()
+        # Referenced names without a definition, reported after each document
+        self._undefined_references: List[str] = []
+
+    def parse_xacro(
+        self, xacro_content: Union[str, bytes], base_path: str = ""
+    ) -> ET.Element:
         """
         Parse XACRO XML content and process XACRO-specific elements
 
         Args:
-            xacro_content: String content of the XACRO file
+            xacro_content: String content of the XACRO file, or its raw bytes,
+                which are handed to the parser without decoding
             base_path: Base path for resolving includes
 
         Returns:
             Root element of the processed XML
         """
         try:
-            root = ET.fromstring(xacro_content)
+            root = _parse_xml(xacro_content)
         except ET.ParseError as e:
             raise ValueError(f"Invalid XACRO XML: {e}")
 
         if root.tag != "robot":
             raise ValueError("XACRO file must have 'robot' as root element")
 
-        # First pass: collect properties, macros, and includes
-        self._collect_xacro_elements(root, base_path)
-
-        # Second pass: expand macros and substitute properties
-        expanded_root = self._expand_xacro_elements(root)
-
-        return expanded_root
-
-    def _collect_xacro_elements(self, element: ET.Element, base_path: str = ""):
-        """Collect XACRO properties, macros, and includes"""
-        elements_to_remove = []
-
-        for child in list(element):
-            # Handle namespace-aware tag checking
-            local_tag = self._get_local_tag(child.tag)
-
-            if local_tag == "property" and self._is_xacro_element(child.tag):
-                # Collect property
-                name = child.get("name")
-                value = child.get("value", "")
-                if name:
-                    # Resolve any property references in the value
-                    value = self._resolve_properties(value)
-                    self.properties[name] = value
-                elements_to_remove.append(child)
-
-            elif local_tag == "macro" and self._is_xacro_element(child.tag):
-                # Collect macro
-                name = child.get("name")
-                if name:
-                    self.macros[name] = child
-                elements_to_remove.append(child)
-
-            elif local_tag == "include" and self._is_xacro_element(child.tag):
-                # Handle include (simplified - just record for now)
-                filename = child.get("filename", "")
-                if filename:
-                    self.includes.append(filename)
-                elements_to_remove.append(child)
+        self._process_xacro_root(root, base_path)
+
+        return root
+
+    def parse_xacro_bytes(
+        self, xacro_bytes: Union[bytes, bytearray], base_path: str = ""
+    ) -> ET.Element:
+        """
+        Parse encoded XACRO XML content and process XACRO-specific elements
+
+        The parser decodes the document itself, honoring its XML declaration,
+        so no intermediate str is built.
 
+        Args:
+            xacro_bytes: Raw bytes of the XACRO file
+            base_path: Base path for resolving includes
+
+        Returns:
+            Root element of the processed XML
+        """
+        return self.parse_xacro(bytes(xacro_bytes), base_path)
+
+    def parse_xacro_file(
+        self, xacro_file: Union[str, BinaryIO], base_path: str = ""
+    ) -> ET.Element:
+        """
+        Parse a XACRO file and process XACRO-specific elements
+
+        The file is parsed from bytes without first reading it into a string.
+
+        Args:
+            xacro_file: Path to the XACRO file or a binary file object
+            base_path: Base path for resolving includes
+
+        Returns:
+            Root element of the processed XML
+        """
+        try:
+            root = _parse_xml_file(xacro_file)
+        except ET.ParseError as e:
+            raise ValueError(f"Invalid XACRO XML: {e}")
+
+        if root.tag != "robot":
+            raise ValueError("XACRO file must have 'robot' as root element")
+
+        self._process_xacro_root(root, base_path)
+
+        return root
+
+    def _process_xacro_root(self, root: ET.Element, base_path: str = ""):
+        """Process the XACRO elements of a parsed document in place"""
+        # properties is public and may have been written directly since the
+        # last document, so start without results cached from earlier values
+        self._invalidate_property_caches()
+        self._undefined_references.clear()
+
+        # Collect definitions, expand macros and substitute properties in one walk
+        self._process_xacro_element(root, base_path)
+        if self._definition_tags:
+            # Drop all definitions (and their tails, as remove() would), including
+            # those copied in by macro expansions. lxml does this in one C-level
+            # pass instead of rebuilding every parent's child list.
+            if HAS_LXML:
+                ET.strip_elements(root, *self._definition_tags, with_tail=True)
+            else:
+                _strip_elements(root, self._definition_tags)
+            self._definition_tags.clear()
+
+        for name in self._undefined_references:
+            warnings.warn(
+                f"XACRO reference '${{{name}}}' is not defined before its use "
+                "and is left unresolved",
+                stacklevel=_caller_stacklevel(),
+            )
+        self._undefined_references.clear()
+
+    def _process_xacro_element(self, element: ET.Element, base_path: str = ""):
+        """
+        Collect and expand XACRO elements below an element in a single walk
+
+        Properties, macros and includes are registered on the way down and
+        removed, macro calls are replaced by their expansion, and property
+        references in attributes and text are resolved on the way back up.
+        Definitions therefore apply to the elements that follow them in
+        document order, as in xacro itself.
+        """
+        children = []
+        modified = False
+
+        for child in element:
+            if self._register_xacro_element(child):
+                # Removed with all other definitions once the walk is done
+                self._definition_tags.add(child.tag)
+            elif self._is_macro_call(child):
+                children.extend(self._expand_macro_call(child))
+                modified = True
+            elif child.tag.startswith("xacro:"):
+                # Skip other XACRO-specific elements
+                modified = True
             else:
-                # Recursively process child elements
-                self._collect_xacro_elements(child, base_path)
+                # Recursively process regular elements
+                self._process_xacro_element(child, base_path)
+                children.append(child)
+
+        if modified:
+            element[:] = children
+
+        # Substitute properties in attributes and text
+        self._resolve_element_properties(element)
+        if element.tail and element.tail.strip():
+            element.tail = self._resolve_properties(element.tail)
+        else:
+            element.tail = None
+
+    def _resolve_element_properties(self, element: ET.Element):
+        """Substitute properties in the attributes and text of an element"""
+        for attr_name, attr_value in element.attrib.items():
+            if "${" in attr_value:
+                element.set(attr_name, self._resolve_properties(attr_value))
+
+        if element.text and element.text.strip():
+            element.text = self._resolve_properties(element.text)
+        else:
+            element.text = None
+
+    def _register_xacro_element(self, element: ET.Element) -> bool:
+        """
+        Register a XACRO property, macro or include definition
+
+        Returns:
+            True if the element is a definition and should be removed
+        """
+        # Handle namespace-aware tag checking
+        local_tag = self._get_local_tag(element.tag)
+        if local_tag not in ("property", "macro", "include"):
+            return False
+        if not self._is_xacro_element(element.tag):
+            return False
 
-        # Remove processed XACRO elements
-        for elem in elements_to_remove:
-            element.remove(elem)
+        name = element.get("name")
+        if local_tag == "property":
+            if name:
+                # Resolve any property references in the value
+                value = self._resolve_properties(element.get("value", ""))
+                self.set_property(name, value)
+
+        elif local_tag == "macro":
+            if name:
+                self.macros[name] = element
+                self._compiled_macros[name] = _compile_macro(
+                    "".join(
+                        ET.tostring(macro_child, encoding="unicode")
+                        for macro_child in element
+                    )
+                )
+                self._expansion_cache.clear()
+
+        else:
+            # Handle include (simplified - just record for now)
+            filename = element.get("filename", "")
+            if filename:
+                self.includes.append(filename)
+
+        return True
 
     def _get_local_tag(self, tag: str) -> str:
         """Get the local part of a namespaced tag"""
@@ -707,55 +1183,58 @@ class XacroToURDFConverter:
             return local in ["property", "macro", "include"] or prefix == "xacro"
         return False
 
-    def _resolve_properties(self, text: str) -> str:
-        """Resolve property references in text using ${property_name} syntax"""
-        import re
+    def set_property(self, name: str, value: str):
+        """
+        Register a property and drop cached results derived from the properties
 
-        def replace_property(match) -> str:
-            prop_name = match.group(1)
-            return self.properties.get(prop_name, match.group(0)) or match.group(0)
+        Writing ``properties`` directly is also supported between documents;
+        the caches are cleared at the start of each parse.
 
-        # Replace ${property_name} patterns
-        result = re.sub(r"\$\{([^}]+)\}", replace_property, text)
-        return result
+        Args:
+            name: Property name
+            value: Resolved property value
+        """
+        self.properties[name] = value
+        self._invalidate_property_caches()
 
-    def _expand_xacro_elements(self, element: ET.Element) -> ET.Element:
-        """Expand XACRO elements and substitute properties"""
-        # Create a new element to avoid modifying during iteration
-        new_element = ET.Element(element.tag)
+    def _invalidate_property_caches(self):
+        """Drop all cached results derived from the properties"""
+        self._expansion_cache.clear()
+        self._resolved_texts.clear()
 
-        # Copy attributes with property substitution
-        for attr_name, attr_value in element.attrib.items():
-            if attr_name.startswith("xmlns"):
-                # Skip XACRO namespace declarations in output
-                if "xacro" not in attr_value:
-                    new_element.set(attr_name, attr_value)
-            else:
-                resolved_value = self._resolve_properties(attr_value)
-                new_element.set(attr_name, resolved_value)
-
-        # Process children
-        for child in element:
-            if self._is_macro_call(child):
-                # Expand macro call
-                expanded_elements = self._expand_macro_call(child)
-                for expanded in expanded_elements:
-                    new_element.append(expanded)
-            elif child.tag.startswith("xacro:") and not self._is_macro_call(child):
-                # Skip other XACRO-specific elements that weren't handled in collection
-                continue
-            else:
-                # Recursively process regular elements
-                expanded_child = self._expand_xacro_elements(child)
-                new_element.append(expanded_child)
+    def _resolve_properties(self, text: str) -> str:
+        """Resolve property references in text using ${property_name} syntax"""
+        # Most attribute values contain no references at all
+        if "${" not in text:
+            return text
+
+        resolved = self._resolved_texts.get(text)
+        if resolved is None:
+            resolved = self._resolved_texts[text] = self._substitute_properties(text)
+            if "${" in resolved:
+                # Definitions only apply to what follows them in the document;
+                # defined but empty properties are left unresolved on purpose
+                for name in _PROP_RE.findall(resolved):
+                    if (
+                        name not in self.properties
+                        and name not in self._undefined_references
+                    ):
+                        self._undefined_references.append(name)
+        return resolved
+
+    def _substitute_properties(self, text: str) -> str:
+        """Substitute property references in text that contains at least one"""
+        if _substitute_compiled is not None:
+            return _substitute_compiled(text, self.properties)
+
+        # Bind the lookup once instead of resolving self.properties per match
+        get_property = self.properties.get
 
-        # Handle text content
-        if element.text and element.text.strip():
-            new_element.text = self._resolve_properties(element.text)
-        if element.tail and element.tail.strip():
-            new_element.tail = self._resolve_properties(element.tail)
+        def replace_property(match) -> str:
+            return get_property(match.group(1)) or match.group(0)
 
-        return new_element
+        # Replace ${property_name} patterns
+        return _PROP_RE.sub(replace_property, text)
 
     def _is_macro_call(self, element: ET.Element) -> bool:
         """Check if element is a macro call"""
@@ -786,7 +1265,8 @@ class XacroToURDFConverter:
         if macro_name in self.macros:
             macro_def = self.macros[macro_name]
         elif call_element.tag in self.macros:
-            macro_def = self.macros[call_element.tag]
+            macro_name = call_element.tag
+            macro_def = self.macros[macro_name]
 
         if macro_def is None:
             # Return empty list if macro not found
@@ -802,98 +1282,125 @@ class XacroToURDFConverter:
             if attr_name in param_names:
                 param_values[attr_name] = self._resolve_properties(attr_value)
 
-        # Expand macro content
-        expanded_elements = []
-        for macro_child in macro_def:
-            expanded = self._expand_macro_content(macro_child, param_values)
-            if expanded is not None:
-                expanded_elements.append(expanded)
+        # Reuse a previous expansion with the same arguments, unless an argument
+        # still holds an unresolved reference
+        cache_key = None
+        if not any("${" in value for value in param_values.values()):
+            cache_key = (macro_name, frozenset(param_values.items()))
+            cached = self._expansion_cache.get(cache_key)
+            if cached is not None:
+                self._expansion_cache.move_to_end(cache_key)
+                return [_parse_xml(blob) for blob in cached]
+
+        # Expand macro content by filling the serialized body and parsing it once.
+        # Values are escaped for XML; empty ones keep the reference, as before.
+        macro_xml = self._compiled_macros[macro_name](
+            {
+                param_name: escape(value, {'"': "&quot;"})
+                for param_name, value in param_values.items()
+                if value
+            }
+        )
+        expansion = _parse_xml(f"<expansion>{macro_xml}</expansion>")
+        if HAS_LXML:
+            # Drop namespace declarations inherited from the macro definition
+            ET.cleanup_namespaces(expansion)
+
+        expanded_elements = list(expansion)
+        for expanded in expanded_elements:
+            for elem in expanded.iter():
+                self._resolve_element_properties(elem)
+                elem.tail = None
+
+        if cache_key is not None:
+            self._expansion_cache[cache_key] = [
+                ET.tostring(expanded) for expanded in expanded_elements
+            ]
+            if len(self._expansion_cache) > MACRO_EXPANSION_CACHE_SIZE:
+                self._expansion_cache.popitem(last=False)
 
         return expanded_elements
 
-    def _expand_macro_content(
-        self, element: ET.Element, params: Dict[str, str]
-    ) -> Optional[ET.Element]:
-        """Expand macro content with parameter substitution"""
-        # Create new element
-        new_element = ET.Element(element.tag)
-
-        # Copy and substitute attributes
-        for attr_name, attr_value in element.attrib.items():
-            substituted_value = self._substitute_parameters(attr_value, params)
-            substituted_value = self._resolve_properties(substituted_value)
-            new_element.set(attr_name, substituted_value)
-
-        # Process children
-        for child in element:
-            expanded_child = self._expand_macro_content(child, params)
-            if expanded_child is not None:
-                new_element.append(expanded_child)
-
-        # Handle text content
-        if element.text and element.text.strip():
-            substituted_text = self._substitute_parameters(element.text, params)
-            substituted_text = self._resolve_properties(substituted_text)
-            new_element.text = substituted_text
-
-        return new_element
-
-    def _substitute_parameters(self, text: str, params: Dict[str, str]) -> str:
-        """Substitute macro parameters in text using ${param_name} syntax"""
-        import re
-
-        def replace_param(match) -> str:
-            param_name = match.group(1)
-            return params.get(param_name, match.group(0)) or match.group(0)
-
-        # Replace ${param_name} patterns
-        result = re.sub(r"\$\{([^}]+)\}", replace_param, text)
-        return result
-
-    def generate_urdf(self, robot_name: str, processed_root: ET.Element) -> str:
+    def generate_urdf(
+        self,
+        robot_name: str,
+        processed_root: ET.Element,
+        pretty: bool = True,
+        as_bytes: bool = False,
+    ) -> Union[str, bytes]:
         """
         Generate clean URDF content from processed XACRO
 
+        The processed root is turned into the URDF root in place, so no
+        elements are copied or moved between trees.
+
         Args:
             robot_name: Name of the robot
             processed_root: Processed XACRO root element
+            pretty: Indent the output; disable for compact, faster output
+            as_bytes: Return UTF-8 encoded bytes, ready to write to a binary file
 
         Returns:
-            URDF content as string
+            URDF content as string, or as bytes if as_bytes is set
         """
-        # Create clean URDF root
-        urdf_root = ET.Element("robot")
+        # Reuse the processed root as a clean URDF root
+        urdf_root = processed_root
+        urdf_root.attrib.clear()
         urdf_root.set("name", robot_name)
 
-        # Copy all non-XACRO elements
-        for child in processed_root:
-            if not child.tag.startswith("xacro:"):
-                urdf_root.append(child)
+        # Drop remaining XACRO elements; parsed XACRO tags are in {namespace}
+        # form, so match by namespace rather than by a "xacro:" prefix
+        if HAS_LXML:
+            leftovers = self._XP_XACRO_CHILDREN(urdf_root)
+        else:
+            leftovers = [
+                child for child in urdf_root if self._is_xacro_element(child.tag)
+            ]
+        for child in leftovers:
+            # Typically a call to a macro that is defined later or not at all
+            warnings.warn(
+                f"Dropping unexpanded XACRO element "
+                f"'{self._get_local_tag(child.tag)}' from the URDF",
+                stacklevel=_caller_stacklevel(),
+            )
+            urdf_root.remove(child)
+        if HAS_LXML:
+            # Drop the xacro declaration the URDF no longer uses
+            ET.cleanup_namespaces(urdf_root)
 
         # Format and return
-        return self._format_urdf_xml(urdf_root)
+        return self._format_urdf_xml(urdf_root, pretty, as_bytes)
 
-    def _format_urdf_xml(self, root: ET.Element) -> str:
+    def _format_urdf_xml(
+        self, root: ET.Element, pretty: bool = True, as_bytes: bool = False
+    ) -> Union[str, bytes]:
         """Format XML with proper indentation"""
-        xml_str = ET.tostring(root, encoding="unicode")
-
-        # Parse with minidom for pretty printing
-        from xml.dom import minidom
-
-        dom = minidom.parseString(xml_str)
-        pretty_xml = dom.toprettyxml(indent="  ")
-
-        # Remove empty lines and fix formatting
-        lines = [line for line in pretty_xml.split("\n") if line.strip()]
-
-        # Replace the first line with proper XML declaration
-        if lines and lines[0].startswith("<?xml"):
-            lines[0] = '<?xml version="1.0"?>'
+        # Serializing straight to UTF-8 saves encoding the string afterwards
+        encoding = "utf-8" if as_bytes else "unicode"
+        header = f"{XML_DECLARATION}\n"
+        if as_bytes:
+            header = header.encode("utf-8")
+
+        if not pretty:
+            # Serialize as is, skipping any reformatting
+            return header + ET.tostring(root, encoding=encoding)
+
+        if HAS_LXML:
+            # libxml2 indents while serializing, without a second DOM
+            pretty_xml = ET.tostring(root, pretty_print=True, encoding=encoding)
+        else:
+            # Indent in place instead of reparsing through minidom
+            ET.indent(root, space="  ")
+            pretty_xml = ET.tostring(root, encoding=encoding)
 
-        return "\n".join(lines)
+        return header + pretty_xml.rstrip()
 
     def convert_file(
-        self, input_file: str, output_file: str, robot_name: Optional[str] = None
+        self,
+        input_file: str,
+        output_file: str,
+        robot_name: Optional[str] = None,
+        pretty: bool = True,
     ) -> None:
         """
         Convert a XACRO file to URDF format
@@ -902,40 +1409,41 @@ class XacroToURDFConverter:
             input_file: Path to input XACRO file
             output_file: Path to output URDF file
             robot_name: Name for the robot (extracted from XACRO if not provided)
+            pretty: Indent the output; disable for compact, faster output
         """
-        import os
-
         # Get base path for includes
         base_path = os.path.dirname(input_file)
 
-        # Read XACRO file
+        # Open XACRO file
         try:
-            with open(input_file, "r", encoding="utf-8") as f:
-                xacro_content = f.read()
+            xacro_file = open(input_file, "rb")
         except FileNotFoundError:
             raise FileNotFoundError(f"XACRO file not found: {input_file}")
         except Exception as e:
             raise IOError(f"Error reading XACRO file: {e}")
 
         # Parse and process XACRO
-        processed_root = self.parse_xacro(xacro_content, base_path)
+        with xacro_file:
+            processed_root = self.parse_xacro_file(xacro_file, base_path)
 
         # Extract robot name if not provided
         if robot_name is None:
             robot_name = processed_root.get("name", "robot")
 
         # Generate URDF
-        urdf_content = self.generate_urdf(robot_name, processed_root)
+        urdf_content = self.generate_urdf(
+            robot_name, processed_root, pretty, as_bytes=True
+        )
 
-        # Write URDF file
+        # Write URDF file in one binary write, without a text layer
         try:
-            with open(output_file, "w", encoding="utf-8") as f:
+            with open(output_file, "wb") as f:
                 f.write(urdf_content)
         except Exception as e:
             raise IOError(f"Error writing URDF file: {e}")
 
     def convert_string(
-        self, xacro_content: str, robot_name: Optional[str] = None
+        self, xacro_content: str, robot_name: Optional[str] = None, pretty: bool = True
     ) -> str:
         """
         Convert XACRO content string to URDF format
@@ -943,6 +1451,7 @@ class XacroToURDFConverter:
         Args:
             xacro_content: XACRO content as string
             robot_name: Name for the robot (extracted from XACRO if not provided)
+            pretty: Indent the output; disable for compact, faster output
 
         Returns:
             URDF content as string
@@ -955,7 +1464,7 @@ class XacroToURDFConverter:
             robot_name = processed_root.get("name", "robot")
 
         # Generate and return URDF
-        return self.generate_urdf(robot_name, processed_root)
+        return self.generate_urdf(robot_name, processed_root, pretty)
 
 
 @dataclass
@@ -963,13 +1472,13 @@ class ConverterArgs:
     """Command-line arguments for the URDF <-> XACRO converter"""
 
     input_file: str
-    """Input file path (URDF or XACRO)"""
+    """Input file path (URDF or XACRO), or a directory or glob to batch convert"""
 
     output: Optional[str] = None
-    """Output file path (auto-detected if not specified)"""
+    """Output file path, or directory in batch mode (auto-detected if not specified)"""
 
     name: Optional[str] = None
-    """Robot name (default: extracted from input file)"""
+    """Robot name (default: extracted from input file; single files only)"""
 
     mode: Literal["auto", "urdf2xacro", "xacro2urdf"] = "auto"
     """Conversion mode (default: auto-detect from file extension)"""
@@ -977,15 +1486,137 @@ class ConverterArgs:
     verbose: bool = False
     """Enable verbose output"""
 
+    pretty: bool = True
+    """Indent the output (--no-pretty writes compact XML faster)"""
+
+    jobs: Optional[int] = None
+    """Worker processes for batch conversion (default: number of CPUs)"""
+
+
+def _convert_one(
+    input_file: str,
+    output_file: str,
+    mode: str,
+    robot_name: Optional[str] = None,
+    pretty: bool = True,
+) -> None:
+    """Convert a single file with a fresh converter (picklable batch worker)"""
+    if mode == "urdf2xacro":
+        converter = URDFToXacroConverter()
+    else:
+        converter = XacroToURDFConverter()
+    converter.convert_file(input_file, output_file, robot_name, pretty)
+
+
+def _convert_batch(args: ConverterArgs) -> int:
+    """Convert all URDF/XACRO files in a directory or matching a glob pattern"""
+    if args.name:
+        # A single name would be given to every robot in the batch
+        print("Error: --name cannot be used when converting several files")
+        return 1
+
+    from_directory = os.path.isdir(args.input_file)
+    if from_directory:
+        pattern = os.path.join(args.input_file, "*")
+    else:
+        pattern = args.input_file
+
+    # Resolve the mode and output path of each input file
+    jobs = []
+    for input_file in sorted(glob.glob(pattern)):
+        if not os.path.isfile(input_file):
+            continue
+        base_name, input_ext = os.path.splitext(input_file)
+        # Directories may hold anything, so only take their robot descriptions
+        if from_directory and input_ext.lower() not in (".urdf", ".xacro"):
+            continue
+        mode = args.mode
+        if mode == "auto":
+            mode = {".urdf": "urdf2xacro", ".xacro": "xacro2urdf"}.get(
+                input_ext.lower()
+            )
+            if mode is None:
+                continue
+        output_ext = ".xacro" if mode == "urdf2xacro" else ".urdf"
+        if args.output:
+            output_file = os.path.join(
+                args.output, os.path.basename(base_name) + output_ext
+            )
+        else:
+            output_file = base_name + output_ext
+        jobs.append((input_file, output_file, mode))
+
+    if not jobs:
+        print(f"Error: No URDF or XACRO files found for '{args.input_file}'")
+        return 1
+
+    # Jobs run concurrently, so an output must neither replace another job's
+    # input (e.g. a foo.urdf/foo.xacro pair) nor be written by two jobs
+    input_paths = {os.path.realpath(input_file) for input_file, _, _ in jobs}
+    output_owners: Dict[str, str] = {}
+    conflicts = []
+    for input_file, output_file, _ in jobs:
+        output_path = os.path.realpath(output_file)
+        if output_path in input_paths:
+            conflicts.append(
+                f"{input_file} -> {output_file} would overwrite an input file "
+                "(use --output to write to a separate directory)"
+            )
+        elif output_path in output_owners:
+            conflicts.append(
+                f"{input_file} -> {output_file} is also written from "
+                f"{output_owners[output_path]}"
+            )
+        else:
+            output_owners[output_path] = input_file
+    if conflicts:
+        for conflict in conflicts:
+            print(f"Error: {conflict}")
+        print("Nothing was converted")
+        return 1
+
+    if args.output:
+        os.makedirs(args.output, exist_ok=True)
+
+    # Parsing and serialization are CPU bound, so convert in separate processes
+    failed = 0
+    with ProcessPoolExecutor(max_workers=args.jobs) as executor:
+        futures = [
+            executor.submit(
+                _convert_one, input_file, output_file, mode, pretty=args.pretty
+            )
+            for input_file, output_file, mode in jobs
+        ]
+        for future, (input_file, output_file, _) in zip(futures, jobs):
+            try:
+                future.result()
+            except Exception as e:
+                print(f"Error: {input_file}: {e}")
+                failed += 1
+            else:
+                if args.verbose:
+                    print(f"Converted: {input_file} -> {output_file}")
+
+    if args.verbose:
+        print(f"Converted {len(jobs) - failed} of {len(jobs)} files")
+
+    return 1 if failed else 0
+
 
 def main():
     """Command-line interface for the URDF <-> XACRO converter"""
-    import os
+    # Imported here so programmatic users of the converters don't load it
+    import tyro
 
     args = tyro.cli(ConverterArgs, description="Convert between URDF and XACRO formats")
 
+    # Batch convert directories and glob patterns
+    if os.path.isdir(args.input_file) or glob.has_magic(args.input_file):
+        return _convert_batch(args)
+
     # Determine conversion mode
-    input_ext = os.path.splitext(args.input_file)[1].lower()
+    base_name, input_ext = os.path.splitext(args.input_file)
+    input_ext = input_ext.lower()
 
     if args.mode == "auto":
         if input_ext == ".urdf":
@@ -1005,7 +1636,6 @@ def main():
     if args.output:
         output_file = args.output
     else:
-        base_name = os.path.splitext(args.input_file)[0]
         if mode == "urdf2xacro":
             output_file = f"{base_name}.xacro"
         else:  # xacro2urdf
@@ -1015,7 +1645,7 @@ def main():
     try:
         if mode == "urdf2xacro":
             converter = URDFToXacroConverter()
-            converter.convert_file(args.input_file, output_file, args.name)
+            converter.convert_file(args.input_file, output_file, args.name, args.pretty)
 
             if args.verbose:
                 print(
@@ -1027,7 +1657,7 @@ def main():
 
         else:  # xacro2urdf
             converter = XacroToURDFConverter()
-            converter.convert_file(args.input_file, output_file, args.name)
+            converter.convert_file(args.input_file, output_file, args.name, args.pretty)
 
             if args.verbose:
                 print(
@@ -1045,6 +1675,4 @@ def main():
 
 
 if __name__ == "__main__":
-    import sys
-
     sys.exit(main())
@@ -0,0 +1,47 @@
+# cython: language_level=3
+"""Compiled helpers for the URDF/XACRO converter"""
+
+
+cpdef str substitute(str text, dict properties):
+    """
+    Replace ${name} references in text with their property values
+
+    Matches the ${[^}]+} pattern used by the converter: references to missing
+    or empty properties are left unchanged.
+
+    Args:
+        text: Text containing property references
+        properties: Property values keyed by name
+
+    Returns:
+        Text with the references substituted
+    """
+    cdef list pieces = []
+    cdef Py_ssize_t copied = 0
+    cdef Py_ssize_t search = 0
+    cdef Py_ssize_t start, end
+    cdef object value
+
+    while True:
+        start = text.find("${", search)
+        if start == -1:
+            break
+        end = text.find("}", start + 2)
+        if end == -1:
+            break
+        if end == start + 2:
+            # "${}" is not a reference
+            search = start + 2
+            continue
+
+        value = properties.get(text[start + 2 : end])
+        if value:
+            pieces.append(text[copied:start])
+            pieces.append(value)
+            copied = end + 1
+        search = end + 1
+
+    if not pieces:
+        return text
+    pieces.append(text[copied:])
+    return "".join(pieces)
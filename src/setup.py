@@ -0,0 +1,14 @@
+"""
+Build the optional compiled helpers of the converter
+
+Usage:
+    python setup.py build_ext --inplace
+"""
+
+from Cython.Build import cythonize
+from setuptools import setup
+
+setup(
+    name="converter_fast",
+    ext_modules=cythonize(["converter_fast.pyx"], language_level=3),
+)